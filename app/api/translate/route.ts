@@ -56,26 +56,32 @@ export async function POST(req: Request) {
     if (usePythonService) {
       // Try to call the IndicTrans2 Python service
       try {
-        const response = await fetch(`${TRANSLATION_SERVICE_URL}/translate`, {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            text,
-            sourceLang,
-            targetLang,
-          }),
+        // Use the cacheable GET endpoint so the data cache and CDNs can reuse results
+        const params = new URLSearchParams({ text, sourceLang, targetLang });
+        const response = await fetch(`${TRANSLATION_SERVICE_URL}/translate?${params}`, {
+          method: 'GET',
+          // Only English-source results are real translations; others are placeholders
+          next: { revalidate: sourceLang === 'en' ? 86400 : 0 },
           // Add timeout for serverless environments
           signal: AbortSignal.timeout(10000), // 10 second timeout
         });
 
         if (response.ok) {
           const data = await response.json();
-          return NextResponse.json({ 
-            translatedText: data.translatedText,
-            timeMs: data.timeMs 
-          });
+          const headers = new Headers();
+          const cacheControl = response.headers.get('cache-control');
+          if (cacheControl) headers.set('cache-control', cacheControl);
+          // The body is re-serialized here, so pass the service's validator on as a weak
+          // ETag without its content-encoding suffix
+          const etag = response.headers.get('etag')?.replace(/^W\//, '').replace(/-(gzip|br)"$/, '"');
+          if (etag) headers.set('etag', `W/${etag}`);
+          return NextResponse.json(
+            {
+              translatedText: data.translatedText,
+              timeMs: Number(response.headers.get('x-translation-time-ms') ?? 0)
+            },
+            { headers }
+          );
         }
       } catch (fetchError) {
         console.log('Python service unavailable, using fallback:', fetchError);
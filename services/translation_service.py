@@ -6,26 +6,307 @@ import threading
 import asyncio
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
+import os
+import random
+import atexit
 import logging
+import logging.handlers
+import queue
+import gzip
+import copy
 from functools import lru_cache
 import signal
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Flask for HTTP API
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('translation_service.log')
-    ]
-)
+# Brotli is optional; responses fall back to gzip when it is not installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Invalid logging settings fall back to defaults; warnings are logged once logging is set up
+_config_warnings: List[str] = []
+
+def _env_setting(name: str, default, parse):
+    """Read and parse an environment variable, falling back to the default if it is invalid."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return parse(raw)
+    except ValueError:
+        _config_warnings.append(f"Invalid {name}={raw!r}, using default {default!r}")
+        return default
+
+def _parse_log_level(value: str) -> str:
+    level = value.upper()
+    if not isinstance(logging.getLevelName(level), int):
+        raise ValueError(value)
+    return level
+
+def _parse_log_format(value: str) -> str:
+    if value not in ('json', 'text'):
+        raise ValueError(value)
+    return value
+
+def _parse_sample_rate(value: str) -> float:
+    rate = float(value)
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(value)
+    return rate
+
+def _parse_exception_limit(value: str) -> int:
+    limit = int(value)
+    if limit < 0:
+        raise ValueError(value)
+    return limit
+
+# Logging configuration
+LOG_LEVEL = _env_setting('TRANSLATION_LOG_LEVEL', 'INFO', _parse_log_level)
+LOG_FORMAT = _env_setting('TRANSLATION_LOG_FORMAT', 'json', _parse_log_format)  # 'json' or 'text'
+LOG_FILE = os.environ.get('TRANSLATION_LOG_FILE', 'translation_service.log')
+LOG_QUEUE_SIZE = 10000  # Records dropped (not blocked on) once the queue is full
+LOG_SAMPLE_RATE = _env_setting('TRANSLATION_LOG_SAMPLE_RATE', 0.1, _parse_sample_rate)  # Fraction of per-request logs kept
+LOG_EXCEPTION_LIMIT = _env_setting('TRANSLATION_LOG_EXCEPTION_LIMIT', 10, _parse_exception_limit)  # Tracebacks per window per message
+LOG_EXCEPTION_WINDOW = 60  # seconds
+LOG_EXCEPTION_MAX_KEYS = 1000  # Distinct messages tracked by the traceback rate limiter
+LOG_SUMMARY_INTERVAL = 60  # seconds between reports of dropped/suppressed records
+LOG_SHUTDOWN_TIMEOUT = 5  # seconds to wait for the queue to drain at exit
+
+# Attributes present on every LogRecord; anything else was passed via `extra`
+_RESERVED_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload['exception'] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+def _tag_access_log(record: logging.LogRecord) -> bool:
+    """Mark werkzeug access lines below WARNING as per-request so they are sampled."""
+    # Access lines look like '<addr> - - [<date>] "GET ..." 200 -'; startup messages do not
+    if record.levelno < logging.WARNING and ' - - [' in str(record.msg):
+        record.per_request = True
+    return True
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of records marked with extra={'per_request': True}."""
+    
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, 'per_request', False):
+            return random.random() < self.rate
+        return True
+
+class ExceptionRateLimitFilter(logging.Filter):
+    """
+    Limit how many tracebacks are logged per message within a time window.
+    
+    Records over the limit are still emitted, but without exc_info, so the
+    traceback is never formatted. The total number of suppressed tracebacks
+    is collected with take_suppressed().
+    """
+    
+    def __init__(self, limit: int, window: float):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._counts: Dict[Tuple[str, Any], Tuple[float, int]] = {}
+        self._suppressed = 0
+        self._lock = threading.Lock()
+    
+    def take_suppressed(self) -> int:
+        """Return and reset the number of tracebacks suppressed so far."""
+        with self._lock:
+            suppressed, self._suppressed = self._suppressed, 0
+        return suppressed
+    
+    def prune(self):
+        """Forget messages whose window has expired."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (start, _) in self._counts.items() if now - start >= self.window]
+            for key in expired:
+                del self._counts[key]
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not record.exc_info:
+            return True
+        
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._counts and len(self._counts) >= LOG_EXCEPTION_MAX_KEYS:
+                # Evict the oldest entry; pre-formatted messages can create unbounded keys
+                del self._counts[next(iter(self._counts))]
+            window_start, count = self._counts.get(key, (now, 0))
+            if now - window_start >= self.window:
+                window_start, count = now, 0
+            count += 1
+            if count > self.limit:
+                self._suppressed += 1
+                record.exc_info = None
+                record.exc_text = None
+            self._counts[key] = (window_start, count)
+        return True
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks and defers formatting to the listener.
+    
+    The stock QueueHandler fully formats each record, traceback included,
+    in the calling thread. Here only the message is merged with its args
+    (cheap, and it snapshots them before they can change); the traceback
+    is formatted later by the listener thread. The tradeoff is that a
+    queued record with exc_info keeps its traceback frames alive until it
+    is drained. Records are dropped when the queue is full; the number
+    dropped is collected with take_dropped().
+    """
+    
+    def __init__(self, queue_):
+        super().__init__(queue_)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+    
+    def take_dropped(self) -> int:
+        """Return and reset the number of records dropped so far."""
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+class SummarizingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that reports lost log records and shuts down safely.
+    
+    Every LOG_SUMMARY_INTERVAL seconds, and once more on stop(), it emits a
+    warning with the number of records dropped by the queue handler and
+    tracebacks suppressed by the rate limiter since the last report.
+    """
+    
+    def __init__(self, queue_handler: NonBlockingQueueHandler,
+                 rate_limiter: ExceptionRateLimitFilter, *handlers):
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self.rate_limiter = rate_limiter
+        self._last_summary = time.monotonic()
+    
+    def handle(self, record: logging.LogRecord):
+        super().handle(record)
+        if time.monotonic() - self._last_summary >= LOG_SUMMARY_INTERVAL:
+            self.emit_summary()
+    
+    def emit_summary(self):
+        """Emit a warning record if any log records were lost since the last summary."""
+        self._last_summary = time.monotonic()
+        self.rate_limiter.prune()
+        dropped = self.queue_handler.take_dropped()
+        suppressed = self.rate_limiter.take_suppressed()
+        if not dropped and not suppressed:
+            return
+        
+        record = logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': "Logging backlog: dropped %d records, suppressed %d tracebacks",
+            'args': (dropped, suppressed),
+            'dropped_records': dropped,
+            'suppressed_tracebacks': suppressed,
+        })
+        super().handle(record)
+    
+    def stop(self):
+        """
+        Stop the listener, waiting up to LOG_SHUTDOWN_TIMEOUT for the queue to drain.
+        
+        The stock implementation enqueues the sentinel with put_nowait, which
+        raises queue.Full when the bounded queue is saturated.
+        """
+        if self._thread is None:
+            return
+        try:
+            self.queue.put(self._sentinel, timeout=LOG_SHUTDOWN_TIMEOUT)
+            self._thread.join(LOG_SHUTDOWN_TIMEOUT)
+        except queue.Full:
+            pass
+        self._thread = None
+        self.emit_summary()
+
+def configure_logging() -> Optional[SummarizingQueueListener]:
+    """
+    Route all logging through a queue drained by a background listener thread.
+    
+    Like logging.basicConfig, this does nothing if the root logger already
+    has handlers, so embedding applications keep their own configuration.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    
+    if LOG_FORMAT == 'json':
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    output_handlers = [logging.StreamHandler()]
+    if LOG_FILE:
+        output_handlers.append(logging.FileHandler(LOG_FILE))
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+    
+    queue_handler = NonBlockingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    rate_limiter = ExceptionRateLimitFilter(LOG_EXCEPTION_LIMIT, LOG_EXCEPTION_WINDOW)
+    queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+    queue_handler.addFilter(rate_limiter)
+    
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(queue_handler)
+    logging.getLogger('werkzeug').addFilter(_tag_access_log)
+    
+    listener = SummarizingQueueListener(queue_handler, rate_limiter, *output_handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+log_listener = configure_logging()
 logger = logging.getLogger(__name__)
+for _warning in _config_warnings:
+    logger.warning(_warning)
 
 # Global flag for graceful shutdown
 SHUTDOWN = False
@@ -36,6 +317,38 @@ DEFAULT_BEAM_SIZE = 5
 MAX_INPUT_LENGTH = 2000
 CACHE_SIZE = 10000  # Number of translations to cache
 MODEL_LOAD_TIMEOUT = 300  # 5 minutes
+HTTP_CACHE_MAX_AGE = 86400  # 1 day for cacheable GET translations
+COMPRESSION_MIN_SIZE = 500  # Bytes; smaller responses are sent uncompressed
+COMPRESSION_LEVEL = 6
+MODEL_NAME = "ai4bharat/indictrans2-en-indic-1B"
+UNSUPPORTED_SOURCE_NOTE = "[Non-English source translation requires indic->en model]"
+
+# Language code mapping (IndicTrans2 uses specific codes)
+# Mapping from ISO 639-1 codes to IndicTrans2 language_script format
+LANG_MAP = {
+    'en': 'eng_Latn',
+    'hi': 'hin_Deva',
+    'bn': 'ben_Beng',
+    'ta': 'tam_Taml',
+    'te': 'tel_Telu',
+    'kn': 'kan_Knda',
+    'ml': 'mal_Mlym',
+    'mr': 'mar_Deva',
+    'gu': 'guj_Gujr',
+    'pa': 'pan_Guru',
+    'or': 'ory_Orya',
+    'as': 'asm_Beng',
+    'ur': 'urd_Arab',
+    'ne': 'nep_Deva',  # Nepali
+    'sa': 'san_Deva',  # Sanskrit
+    'mni': 'mni_Beng',  # Manipuri (Meitei/Bengali script)
+    'ks': 'kas_Arab',  # Kashmiri (Arabic script)
+    'doi': 'doi_Deva',  # Dogri
+    'kok': 'gom_Deva',  # Konkani
+    'mai': 'mai_Deva',  # Maithili
+    'brx': 'brx_Deva',  # Bodo
+    'sat': 'sat_Olck',  # Santali
+}
 
 @dataclass
 class TranslationConfig:
@@ -116,7 +429,7 @@ class TranslationService:
                 self._initialize_model()
                 logger.info("Model loaded successfully")
             except Exception as e:
-                logger.error(f"Failed to load model: {str(e)}")
+                logger.error("Failed to load model: %s", e)
                 self._model_loading = False
             
         # Start model loading in a separate thread
@@ -130,38 +443,13 @@ class TranslationService:
             # Import transformers and create pipeline
             from transformers import pipeline
 
-            # Language code mapping (IndicTrans2 uses specific codes)
-            # Mapping from ISO 639-1 codes to IndicTrans2 language_script format
-            self.lang_map = {
-                'en': 'eng_Latn',
-                'hi': 'hin_Deva',
-                'bn': 'ben_Beng',
-                'ta': 'tam_Taml',
-                'te': 'tel_Telu',
-                'kn': 'kan_Knda',
-                'ml': 'mal_Mlym',
-                'mr': 'mar_Deva',
-                'gu': 'guj_Gujr',
-                'pa': 'pan_Guru',
-                'or': 'ory_Orya',
-                'as': 'asm_Beng',
-                'ur': 'urd_Arab',
-                'ne': 'nep_Deva',  # Nepali
-                'sa': 'san_Deva',  # Sanskrit
-                'mni': 'mni_Beng',  # Manipuri (Meitei/Bengali script)
-                'ks': 'kas_Arab',  # Kashmiri (Arabic script)
-                'doi': 'doi_Deva',  # Dogri
-                'kok': 'gom_Deva',  # Konkani
-                'mai': 'mai_Deva',  # Maithili
-                'brx': 'brx_Deva',  # Bodo
-                'sat': 'sat_Olck',  # Santali
-            }
+            self.lang_map = LANG_MAP
 
             # Create translation pipeline for English -> Indic languages
             # trust_remote_code enables model-specific translation kwargs (src_lang/tgt_lang)
             self.pipe_en_to_indic = pipeline(
                 "translation",
-                model="ai4bharat/indictrans2-en-indic-1B",
+                model=MODEL_NAME,
                 trust_remote_code=True
             )
             
@@ -169,7 +457,7 @@ class TranslationService:
             self._model_loading = False
             
             load_time = time.time() - start_time
-            logger.info(f"Hugging Face pipeline initialized in {load_time:.2f} seconds")
+            logger.info("Hugging Face pipeline initialized in %.2f seconds", load_time)
             
         except Exception as e:
             logger.exception("Failed to initialize HF IndicTrans2 pipeline")
@@ -191,7 +479,7 @@ class TranslationService:
                 if self._initialized:
                     self.translate(text, src, tgt)
             except Exception as e:
-                logger.warning(f"Warmup failed for {src}->{tgt}: {str(e)}")
+                logger.warning("Warmup failed for %s->%s: %s", src, tgt, e)
     
     def _handle_shutdown(self, signum, frame):
         """Handle shutdown signals gracefully."""
@@ -274,7 +562,7 @@ class TranslationService:
             return sentences, sentence_lengths
             
         except Exception as e:
-            logger.error(f"Preprocessing failed: {str(e)}")
+            logger.error("Preprocessing failed: %s", e)
             raise InvalidInputError(f"Failed to preprocess text: {str(e)}")
     
     def postprocess(self, translated_sentences: List[str], sentence_lengths: List[int]) -> str:
@@ -296,7 +584,7 @@ class TranslationService:
             return ' '.join(translated_sentences)
             
         except Exception as e:
-            logger.error(f"Postprocessing failed: {str(e)}")
+            logger.error("Postprocessing failed: %s", e)
             # Return the best effort result
             return ' '.join(translated_sentences)
     
@@ -350,10 +638,10 @@ class TranslationService:
                 return [outputs.get('translation_text', '')]
 
             # For non-English source, return original for now with note
-            return [f"{s} "+"[Non-English source translation requires indic->en model]" for s in sentences]
+            return [f"{s} {UNSUPPORTED_SOURCE_NOTE}" for s in sentences]
             
         except Exception as e:
-            logger.exception(f"Batch translation failed: {str(e)}")
+            logger.exception("Batch translation failed: %s", e)
             raise TranslationError(f"Failed to translate batch: {str(e)}")
     
     def translate(
@@ -393,7 +681,10 @@ class TranslationService:
         cache_key = self._get_cache_key(text, src_lang, tgt_lang)
         cached = self._get_from_cache(cache_key)
         if cached is not None:
-            logger.debug(f"Cache hit for {src_lang}->{tgt_lang}: {text[:50]}...")
+            logger.debug(
+                "Cache hit for %s->%s", src_lang, tgt_lang,
+                extra={'per_request': True, 'text_length': len(text)}
+            )
             return cached
             
         # Wait for model initialization if needed
@@ -612,6 +903,66 @@ def health_check():
     """Health check endpoint."""
     return jsonify({'status': 'healthy', 'initialized': translator_instance._initialized if translator_instance else False})
 
+def get_content_hash(text: str, src_lang: str, tgt_lang: str, config: TranslationConfig) -> str:
+    """Generate a stable content hash used as the strong ETag for a translation."""
+    key_str = json.dumps(
+        {
+            'model': MODEL_NAME,
+            'text': text,
+            'sourceLang': src_lang,
+            'targetLang': tgt_lang,
+            'config': asdict(config)
+        },
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(key_str.encode('utf-8')).hexdigest()
+
+def _wait_for_translator(max_wait: int = 60):
+    """Return the translator once initialized, or None if it is not ready within max_wait seconds."""
+    translator = get_translator()
+    
+    wait_time = 0
+    while not translator._initialized and wait_time < max_wait:
+        time.sleep(1)
+        wait_time += 1
+    
+    return translator if translator._initialized else None
+
+def _matching_etag(etag: str) -> Optional[str]:
+    """
+    Return the ETag variant matched by If-None-Match, or None.
+    
+    Uses weak comparison as required for If-None-Match, so validators
+    downgraded to W/"..." by intermediaries still revalidate. Each
+    content-encoded variant is checked so a 304 can carry the validator
+    of the representation the client actually holds. The "*" tag is
+    ignored so only a tag the server issued can short-circuit a request.
+    """
+    if request.if_none_match.star_tag:
+        return None
+    for suffix in ('', '-gzip', '-br'):
+        candidate = f"{etag}{suffix}"
+        if request.if_none_match.contains_weak(candidate):
+            return candidate
+    return None
+
+def _validate_request(text: str, src_lang: str, tgt_lang: str):
+    """Reject requests that translate() would reject, before answering from cache."""
+    if len(text) > MAX_INPUT_LENGTH:
+        raise InvalidInputError(f"Input text exceeds maximum length of {MAX_INPUT_LENGTH} characters")
+    if src_lang not in LANG_MAP:
+        raise InvalidInputError(f"Source language '{src_lang}' is not supported")
+    if tgt_lang not in LANG_MAP:
+        raise InvalidInputError(f"Target language '{tgt_lang}' is not supported")
+
+def _cache_headers(response, etag: str):
+    """Attach strong ETag and Cache-Control headers to a cacheable response."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={HTTP_CACHE_MAX_AGE}'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/translate', methods=['POST'])
 def translate_api():
     """Translation API endpoint."""
@@ -628,16 +979,8 @@ def translate_api():
         if not text:
             return jsonify({'error': 'Text is required'}), 400
         
-        translator = get_translator()
-        
-        # Wait for initialization if needed
-        max_wait = 60  # seconds
-        wait_time = 0
-        while not translator._initialized and wait_time < max_wait:
-            time.sleep(1)
-            wait_time += 1
-        
-        if not translator._initialized:
+        translator = _wait_for_translator()
+        if translator is None:
             return jsonify({'error': 'Translation service is not ready'}), 503
         
         start_time = time.time()
@@ -652,25 +995,121 @@ def translate_api():
         })
         
     except TranslationError as e:
-        logger.exception("Translation error")
+        logger.exception("Translation error", extra={'per_request': True})
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception("Unexpected error in translation API")
+        return jsonify({'error': f'Translation failed: {str(e)}'}), 500
+
+@app.route('/translate', methods=['GET'])
+def translate_get_api():
+    """
+    Cacheable translation endpoint.
+    
+    The ETag is derived from the request content alone, so conditional
+    requests are answered with 304 without touching the model. The body
+    omits timing information to stay byte-identical for a given ETag;
+    timing is reported in the X-Translation-Time-Ms header instead.
+    """
+    try:
+        text = request.args.get('text')
+        source_lang = request.args.get('sourceLang', 'en')
+        target_lang = request.args.get('targetLang', 'hi')
+        
+        if not text:
+            return jsonify({'error': 'Text is required'}), 400
+        
+        _validate_request(text, source_lang, target_lang)
+        
+        config = TranslationConfig()
+        etag = get_content_hash(text, source_lang, target_lang, config)
+        
+        # Only English-source results are issued an ETag; others are placeholders
+        matched_etag = _matching_etag(etag) if source_lang == 'en' else None
+        if matched_etag:
+            return _cache_headers(app.response_class(status=304), matched_etag)
+        
+        translator = _wait_for_translator()
+        if translator is None:
+            return jsonify({'error': 'Translation service is not ready'}), 503
+        
+        start_time = time.time()
+        translated_text = translator.translate(text, src_lang=source_lang, tgt_lang=target_lang, config=config)
+        elapsed = (time.time() - start_time) * 1000
+        
+        response = jsonify({
+            'translatedText': translated_text,
+            'sourceLang': source_lang,
+            'targetLang': target_lang
+        })
+        response.headers['X-Translation-Time-Ms'] = f"{elapsed:.2f}"
+        
+        # Placeholder output must not be held by browsers or CDNs
+        if UNSUPPORTED_SOURCE_NOTE in translated_text:
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+        
+        return _cache_headers(response, etag)
+        
+    except TranslationError as e:
+        logger.exception("Translation error", extra={'per_request': True})
         return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.exception("Unexpected error in translation API")
         return jsonify({'error': f'Translation failed: {str(e)}'}), 500
 
+@app.after_request
+def compress_response(response):
+    """Compress sufficiently large JSON responses with brotli or gzip. Streamed responses are left as-is."""
+    if (
+        response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+        or response.mimetype != 'application/json'
+    ):
+        return response
+    
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_SIZE:
+        return response
+    
+    accept_encoding = request.accept_encodings
+    if brotli is not None and accept_encoding['br']:
+        encoding = 'br'
+        compressed = brotli.compress(data, quality=COMPRESSION_LEVEL)
+    elif accept_encoding['gzip']:
+        encoding = 'gzip'
+        # mtime=0 keeps the gzip header, and so the bytes behind the strong ETag, stable
+        compressed = gzip.compress(data, compresslevel=COMPRESSION_LEVEL, mtime=0)
+    else:
+        return response
+    
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    
+    # Each encoding is a distinct representation and needs its own strong ETag
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(f"{etag}-{encoding}")
+    
+    return response
+
 def run_http_server(host='127.0.0.1', port=5000):
     """Run the Flask HTTP server."""
-    logger.info(f"Starting IndicTrans2 Translation HTTP Server on {host}:{port}")
+    logger.info("Starting IndicTrans2 Translation HTTP Server on %s:%s", host, port)
     logger.info("API endpoints:")
     logger.info("  GET  /health - Health check")
     logger.info("  POST /translate - Translate text")
+    logger.info("  GET  /translate?text=...&sourceLang=..&targetLang=.. - Cacheable translation (ETag)")
     
     # Initialize translator in background
     def init_translator():
         try:
             get_translator()
         except Exception as e:
-            logger.error(f"Failed to initialize translator: {e}")
+            logger.error("Failed to initialize translator: %s", e)
     
     threading.Thread(target=init_translator, daemon=True).start()
     